@@ -20,15 +20,32 @@ required credentials and most configuration values.
 """
 
 import argparse
+import base64
+import http.client
+import io
+import itertools
 import logging
 import math
+import mmap
 import os
+import random
+import socket
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import zlib
+from array import array
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from urllib.parse import urlparse
 
 import boto3
+import botocore.httpsession
+import urllib3.connection
 from botocore.config import Config
 from botocore.exceptions import (
     BotoCoreError,
@@ -103,6 +120,34 @@ def parse_args():
         default=int(os.environ.get("MAX_RETRIES", 5)),
         help="Maximum number of retries for each request (default: 5)",
     )
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Read the file with O_DIRECT, bypassing the page cache (chunk size must be a multiple of 4096; not supported by every filesystem)",
+    )
+    parser.add_argument(
+        "--verify-parts",
+        action="store_true",
+        help="List the uploaded parts on the server before completing the upload",
+    )
+    parser.add_argument(
+        "--send-buffer",
+        type=int,
+        default=1024 * 1024,
+        help="Block size in bytes used when writing request bodies to the socket (default: 1024 * 1024 (1MB))",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.environ.get("UPLOAD_CONCURRENCY", DEFAULT_CONCURRENCY)),
+        help=f"Number of parts to upload in parallel (default: UPLOAD_CONCURRENCY environment variable or {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=("thread", "process"),
+        default="thread",
+        help="Upload parts from a pool of threads or of processes (default: thread)",
+    )
     return parser.parse_args()
 
 
@@ -116,6 +161,267 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parts at least this large are memory-mapped instead of read into a buffer.
+MMAP_MIN_PART_SIZE = 8 * 1024 * 1024
+
+# O_DIRECT reads must use offsets, lengths and buffers aligned to this size.
+DIRECT_IO_ALIGNMENT = 4096
+
+# Socket send buffer requested for S3 connections. Setting it turns off the
+# kernel's send-buffer autotuning, so it is only applied when
+# net.core.wmem_max lets the full size through.
+SOCKET_SEND_BUFFER = 4 * 1024 * 1024
+
+# Upper bound in seconds on the delay between retries.
+MAX_BACKOFF = 60
+
+# Upper bound on bytes hinted into the page cache ahead of the workers.
+PREFETCH_BUDGET = 512 * 1024 * 1024
+
+# Seconds between HeadObject checks while waiting for a merge to finish.
+HEAD_POLL_INTERVAL = 5
+
+# Uploads are network bound, so run well past one worker per CPU.
+DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+
+# -----------------------------------------------------------------------------
+# ─── HTTP TUNING ─────────────────────────────────────────────────────────────
+# -----------------------------------------------------------------------------
+def _default_arg_index(func, name: str) -> int | None:
+    """Return the position of ``name``'s default in ``func.__defaults__``.
+
+    Returns None for a keyword-only parameter, whose default lives in
+    ``__kwdefaults__``. Raises ValueError if ``func`` has no such parameter
+    or it has no default.
+    """
+
+    if name in (func.__kwdefaults__ or {}):
+        return None
+    code = func.__code__
+    names = code.co_varnames[: code.co_argcount]
+    if name not in names:
+        raise ValueError(f"{func.__qualname__}() has no parameter {name}")
+    index = names.index(name) - (len(names) - len(func.__defaults__ or ()))
+    if index < 0:
+        raise ValueError(f"{func.__qualname__}() has no default for {name}")
+    return index
+
+
+def _set_default_arg(func, name: str, value, index: int | None) -> None:
+    """Replace the default value of parameter ``name`` of ``func``.
+
+    ``index`` is the position returned by _default_arg_index.
+    """
+
+    if index is None:
+        func.__kwdefaults__ = {**func.__kwdefaults__, name: value}
+        return
+    defaults = list(func.__defaults__)
+    defaults[index] = value
+    func.__defaults__ = tuple(defaults)
+
+
+# Block size most recently applied by set_http_send_buffer, if any.
+_http_send_buffer: int | None = None
+
+
+def set_http_send_buffer(size: int) -> None:
+    """Set the block size HTTP connections use when sending request bodies.
+
+    http.client writes file-like bodies in 8 KiB blocks (urllib3 uses 16 KiB,
+    and botocore passes 128 KiB to urllib3 2.x pools), so a 50 MB part takes
+    hundreds to thousands of send() calls, each releasing and re-acquiring
+    the GIL. Only S3 clients built after this call are affected.
+    """
+
+    global _http_send_buffer
+    classes = (
+        http.client.HTTPConnection,
+        http.client.HTTPSConnection,
+        urllib3.connection.HTTPConnection,
+        urllib3.connection.HTTPSConnection,
+    )
+    # Resolve every default before changing any, so a failure leaves all of
+    # the classes as they were.
+    targets = []
+    try:
+        for cls in classes:
+            func = cls.__init__
+            code = func.__code__
+            params = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+            if (
+                "blocksize" not in params
+                and cls.__module__ != http.client.__name__
+                and issubclass(cls, http.client.HTTPConnection)
+            ):
+                # urllib3 1.x passes blocksize through **kw to http.client,
+                # which picks up the default patched there.
+                continue
+            targets.append((func, _default_arg_index(func, "blocksize")))
+    except (AttributeError, ValueError) as exc:
+        logger.warning(f"Could not set HTTP send buffer to {size} bytes: {exc}")
+        return
+    for func, index in targets:
+        _set_default_arg(func, "blocksize", size, index)
+    # With urllib3 2.x botocore hands its own BUFFER_SIZE to every pool as an
+    # explicit blocksize, which overrides the defaults patched above. It is
+    # read when a client's pool manager is created. None means the urllib3
+    # in use has no blocksize pool key, so the defaults above apply instead.
+    if getattr(botocore.httpsession, "BUFFER_SIZE", None):
+        botocore.httpsession.BUFFER_SIZE = size
+    _http_send_buffer = size
+    logger.debug(f"HTTP send buffer set to {size} bytes")
+
+
+def _max_socket_send_buffer() -> int:
+    """Return net.core.wmem_max, or 0 if it cannot be read."""
+
+    try:
+        with open("/proc/sys/net/core/wmem_max") as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 0
+
+
+def tune_client_sockets(client) -> None:
+    """Request a larger socket send buffer on the connections of ``client``."""
+
+    # An explicit SO_SNDBUF above wmem_max is clamped and also disables
+    # autotuning, which leaves a smaller buffer than the kernel would pick.
+    limit = _max_socket_send_buffer()
+    if limit < SOCKET_SEND_BUFFER:
+        logger.debug(
+            f"Leaving socket send buffer to the kernel (wmem_max {limit} bytes)"
+        )
+        return
+    # botocore already enables TCP_NODELAY but has no public setting for other
+    # socket options, and its event hooks never see the sockets. This relies
+    # on botocore internals: the pools of the private
+    # _endpoint.http_session share _socket_options, so extending that list
+    # applies to every connection the client opens.
+    try:
+        options = client._endpoint.http_session._socket_options
+    except AttributeError:
+        logger.debug("Could not set socket options on S3 client")
+        return
+    option = (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
+    if option not in options:
+        options.append(option)
+
+
+# -----------------------------------------------------------------------------
+# ─── PART BODIES ─────────────────────────────────────────────────────────────
+# -----------------------------------------------------------------------------
+class _RangeReader(io.RawIOBase):
+    """Seekable, read-only file object over ``length`` bytes of some source.
+
+    botocore streams file-like bodies in blocks, so a part sent through a
+    reader is never held in memory in full. Subclasses implement
+    ``_read_at``.
+    """
+
+    def __init__(self, length: int) -> None:
+        super().__init__()
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._length + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size: int | None = -1) -> bytes:
+        remaining = max(0, self._length - self._pos)
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self._read_at(self._pos, size) if size else b""
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        memoryview(b).cast("B")[: len(data)] = data
+        return len(data)
+
+    def _read_at(self, pos: int, size: int) -> bytes:
+        raise NotImplementedError
+
+
+class _PartReader(_RangeReader):
+    """Reader over one part of a file, read with pread as it is sent."""
+
+    def __init__(self, fd: int, offset: int, length: int) -> None:
+        super().__init__(length)
+        self._fd = fd
+        self._offset = offset
+
+    def _read_at(self, pos: int, size: int) -> bytes:
+        # pread does not move a shared file position, so all workers can
+        # read from the one descriptor concurrently.
+        return os.pread(self._fd, size, self._offset + pos)
+
+
+class _BufferReader(_RangeReader):
+    """Reader over a buffer that already holds a part, without copying it.
+
+    botocore does not accept memoryview bodies, and io.BytesIO would copy
+    the whole buffer up front.
+    """
+
+    def __init__(self, buf) -> None:
+        self._view = memoryview(buf).cast("B")
+        super().__init__(len(self._view))
+
+    def _read_at(self, pos: int, size: int) -> bytes:
+        return bytes(self._view[pos : pos + size])
+
+    def getbuffer(self) -> memoryview:
+        """Return a view of the whole buffer."""
+
+        return self._view
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
+# Page-aligned O_DIRECT read buffers, one per worker thread.
+_direct_buffers = threading.local()
+
+
+def _direct_buffer(size: int) -> mmap.mmap:
+    """Return this thread's page-aligned buffer of at least ``size`` bytes."""
+
+    size = -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+    buf = getattr(_direct_buffers, "buf", None)
+    if buf is None or len(buf) < size:
+        # Anonymous mappings are always page aligned.
+        buf = mmap.mmap(-1, size)
+        _direct_buffers.buf = buf
+    return buf
+
 
 # -----------------------------------------------------------------------------
 # ─── UPLOADER CLASS ─────────────────────────────────────────────────────────-
@@ -135,7 +441,22 @@ class LargeMultipartUploader:
         endpoint: str,
         part_size: int = 50 * 1024 * 1024,
         max_retries: int = 5,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: str = "thread",
+        verify_parts: bool = False,
+        direct: bool = False,
     ) -> None:
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}")
+        if direct and not hasattr(os, "O_DIRECT"):
+            raise ValueError("O_DIRECT is not supported on this platform")
+        if direct and part_size % DIRECT_IO_ALIGNMENT:
+            raise ValueError(
+                f"part_size must be a multiple of {DIRECT_IO_ALIGNMENT} with O_DIRECT"
+            )
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
         self.file_path = file_path
         self.bucket = bucket
         self.key = key
@@ -145,9 +466,39 @@ class LargeMultipartUploader:
         self.endpoint = endpoint
         self.part_size = part_size
         self.max_retries = max_retries
+        self.concurrency = concurrency
+        self.executor = executor
+        self.verify_parts = verify_parts
+        self.direct = direct
+        self.use_mmap = (
+            not direct
+            and part_size >= MMAP_MIN_PART_SIZE
+            and part_size % mmap.ALLOCATIONGRANULARITY == 0
+        )
+
+        self._progress = itertools.count(1)
+
+        self._connect()
+        self.upload_id: str | None = None
+        self._fd: int | None = None
+
+    def __getstate__(self) -> dict:
+        # boto3 sessions and clients cannot be pickled; process-pool workers
+        # build their own in _init_process_worker. Progress is only tracked
+        # by the driver.
+        state = self.__dict__.copy()
+        for name in ("session", "botocore_cfg", "s3", "_clients", "_progress"):
+            state.pop(name, None)
+        state["_fd"] = None
+        return state
+
+    def _connect(self) -> None:
+        """Create the boto3 session and S3 client used for all requests.
 
-        self.progress_lock = Lock()
-        self.parts_completed = 0
+        One client is shared by every worker thread: botocore clients are
+        thread safe, and sharing one keeps a single warm connection pool so
+        parts do not pay for new TLS handshakes.
+        """
 
         self.session = boto3.session.Session(
             aws_access_key_id=self.access_key,
@@ -157,11 +508,57 @@ class LargeMultipartUploader:
         self.botocore_cfg = Config(
             region_name=self.region,
             retries={"max_attempts": self.max_retries, "mode": "standard"},
+            max_pool_connections=max(10, self.concurrency),
+            tcp_keepalive=True,
+            s3={"addressing_style": "path"},
         )
-        self.s3 = self.session.client(
-            "s3", config=self.botocore_cfg, endpoint_url=self.endpoint
+        self._clients: dict = {}
+        self.s3 = self.make_client()
+        # Without TLS, botocore sends checksums in a header and so reads the
+        # whole body once just to compute them before sending it. Over HTTPS
+        # it computes a trailing checksum while streaming, in the same pass.
+        # botocore before 1.36 has no request_checksum_calculation setting and
+        # sends no checksum by default, which matches "when_required".
+        checksum_calculation = getattr(
+            self.s3.meta.config, "request_checksum_calculation", "when_required"
         )
-        self.upload_id: str | None = None
+        self.precompute_checksums = (
+            urlparse(self.s3.meta.endpoint_url).scheme != "https"
+            and checksum_calculation != "when_required"
+        )
+
+    def make_client(self, timeout: int | None = None):
+        """Return an S3 client using ``timeout``, built at most once per value.
+
+        Building a client parses the service model, so clients are cached on
+        the uploader and all of them share its one session.
+        """
+
+        client = self._clients.get(timeout)
+        if client is None:
+            cfg = self.botocore_cfg
+            if timeout is not None:
+                cfg = cfg.merge(Config(read_timeout=timeout, connect_timeout=timeout))
+            client = self.session.client("s3", config=cfg, endpoint_url=self.endpoint)
+            tune_client_sockets(client)
+            self._clients[timeout] = client
+        return client
+
+    def open_source(self) -> None:
+        """Open the local file for reading parts."""
+
+        if self._fd is None:
+            flags = os.O_RDONLY | (os.O_DIRECT if self.direct else 0)
+            self._fd = os.open(self.file_path, flags)
+            if not self.direct and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    def close_source(self) -> None:
+        """Close the local file if it is open."""
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
     @staticmethod
     def human_mb_per_s(num_bytes: int, seconds: float) -> float:
@@ -169,6 +566,32 @@ class LargeMultipartUploader:
 
         return (num_bytes / (1024 * 1024)) / seconds if seconds > 0 else float("inf")
 
+    @staticmethod
+    def part_layout(file_size: int, part_size: int) -> tuple[array, array]:
+        """Return the byte offset and length of every part, in part order."""
+
+        offsets = array("q", range(0, file_size, part_size))
+        sizes = array("q", [part_size]) * len(offsets)
+        if offsets:
+            sizes[-1] = file_size - offsets[-1]
+        return offsets, sizes
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """Return ``seconds`` formatted as hours, minutes and seconds."""
+
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}h {minutes:02d}m {secs:02d}s"
+
+    @staticmethod
+    def backoff_delay(attempt: int) -> float:
+        """Return a fully jittered exponential backoff delay for ``attempt``."""
+
+        # Randomizing the whole delay keeps parts that failed together from
+        # retrying in lockstep against the same proxy.
+        return random.uniform(0, min(MAX_BACKOFF, 2**attempt))
+
     @staticmethod
     def is_insufficient_storage_error(exc: Exception) -> bool:
         """Return True if the exception wraps a 507 Insufficient Storage response."""
@@ -187,6 +610,15 @@ class LargeMultipartUploader:
             return meta.get("HTTPStatusCode") == 524
         return False
 
+    @staticmethod
+    def is_not_found_error(exc: Exception) -> bool:
+        """Return True if the exception wraps a 404 Not Found response."""
+
+        if isinstance(exc, ClientError):
+            meta = exc.response.get("ResponseMetadata", {})
+            return meta.get("HTTPStatusCode") == 404
+        return False
+
     @staticmethod
     def is_no_such_upload_error(exc: Exception) -> bool:
         """Return True if the exception reports a missing multipart upload."""
@@ -210,8 +642,8 @@ class LargeMultipartUploader:
                     if attempt == self.max_retries:
                         logger.error(f"{description}: exceeded max_retries for 524")
                         raise
-                    backoff = 2**attempt
-                    logger.info(f"{description}: retrying in {backoff}s...")
+                    backoff = self.backoff_delay(attempt)
+                    logger.info(f"{description}: retrying in {backoff:.1f}s...")
                     time.sleep(backoff)
                     continue
                 raise
@@ -222,8 +654,8 @@ class LargeMultipartUploader:
                 if attempt == self.max_retries:
                     logger.error(f"{description}: exceeded max_retries for timeout")
                     raise
-                backoff = 2**attempt
-                logger.info(f"{description}: retrying in {backoff}s...")
+                backoff = self.backoff_delay(attempt)
+                logger.info(f"{description}: retrying in {backoff:.1f}s...")
                 time.sleep(backoff)
 
     def complete_with_timeout_retry(
@@ -238,27 +670,35 @@ class LargeMultipartUploader:
         if self.upload_id is None:
             raise RuntimeError("upload_id not set")
 
+        # The HeadObject wait doubles on every attempt. The client timeout
+        # only doubles after a client-side timeout, so client_timeout always
+        # matches the client in use.
         timeout = initial_timeout
-        cfg = self.botocore_cfg
+        client_timeout = initial_timeout
         last_exc: Exception | None = None
+        # The completion gets its own client with longer timeouts; self.s3 is
+        # never replaced after _connect.
+        complete_client = self.make_client(client_timeout)
+        switch_client = False
         for attempt in range(1, self.max_retries + 1):
-            cfg = cfg.merge(Config(read_timeout=timeout, connect_timeout=timeout))
-            client = self.session.client("s3", config=cfg, endpoint_url=self.endpoint)
+            if switch_client:
+                client_timeout *= 2
+                complete_client = self.make_client(client_timeout)
+                switch_client = False
             try:
-                client.complete_multipart_upload(
+                complete_client.complete_multipart_upload(
                     Bucket=self.bucket,
                     Key=self.key,
                     UploadId=self.upload_id,
                     MultipartUpload={"Parts": parts_sorted},
                 )
-                self.s3 = client
-                self.botocore_cfg = cfg
                 return
             except (ReadTimeoutError, ConnectTimeoutError) as exc:
                 last_exc = exc
                 no_such_upload = False
+                switch_client = True
                 logger.warning(
-                    f"complete_multipart_upload timed out after {timeout}s: {exc}"
+                    f"complete_multipart_upload timed out after {client_timeout}s: {exc}"
                 )
             except (ClientError, BotoCoreError) as exc:
                 last_exc = exc
@@ -269,30 +709,21 @@ class LargeMultipartUploader:
 
             if no_such_upload:
                 logger.info("Upload session missing; checking object state immediately")
+                wait_seconds = 0
             else:
                 logger.info(
-                    f"Waiting {timeout}s before checking object state to see if merge has completed"
+                    f"Checking object state for up to {timeout}s to see if merge has completed"
                 )
-                time.sleep(timeout)
+                wait_seconds = timeout
 
-            try:
-                head = self.call_with_524_retry(
-                    "head_object",
-                    lambda: client.head_object(Bucket=self.bucket, Key=self.key),
-                )
-                uploaded_size = head.get("ContentLength")
-                if uploaded_size == expected_size:
-                    logger.info(
-                        "HeadObject confirms multipart upload merge has completed"
-                    )
-                    self.s3 = client
-                    self.botocore_cfg = cfg
-                    return
-                logger.info(
-                    "HeadObject size mismatch after timeout; will retry complete_multipart_upload"
-                )
-            except Exception as head_exc:
-                logger.info(f"head_object failed after error: {head_exc}")
+            if self.wait_for_object(
+                complete_client, expected_size=expected_size, wait_seconds=wait_seconds
+            ):
+                logger.info("HeadObject confirms multipart upload merge has completed")
+                return
+            logger.info(
+                "Object not complete after waiting; will retry complete_multipart_upload"
+            )
 
             if attempt == self.max_retries:
                 raise (
@@ -304,7 +735,91 @@ class LargeMultipartUploader:
                 )
 
             timeout *= 2
-            logger.info(f"Increasing timeout to {timeout}s and retrying")
+            if switch_client:
+                logger.info(f"Increasing timeout to {client_timeout * 2}s and retrying")
+            else:
+                logger.info(
+                    f"Retrying with the {client_timeout}s client; "
+                    f"next object state check waits up to {timeout}s"
+                )
+
+    def wait_for_object(
+        self, client, *, expected_size: int, wait_seconds: float
+    ) -> bool:
+        """Poll HeadObject until the object is complete or ``wait_seconds`` pass.
+
+        Returns True as soon as the object reports ``expected_size`` bytes, so
+        a merge that finishes early does not cost the full wait.
+        """
+
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            try:
+                head = self.call_with_524_retry(
+                    "head_object",
+                    lambda: client.head_object(Bucket=self.bucket, Key=self.key),
+                )
+                if head.get("ContentLength") == expected_size:
+                    return True
+            except Exception as head_exc:
+                if not self.is_not_found_error(head_exc):
+                    logger.info(f"head_object failed after error: {head_exc}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, HEAD_POLL_INTERVAL * random.uniform(0.8, 1.2)))
+
+    def prefetch_part(self, offset: int, length: int) -> None:
+        """Ask the kernel to start reading a queued part into the page cache."""
+
+        # The readahead runs in the kernel while workers are busy sending
+        # earlier parts, so a worker rarely waits on the disk when it starts.
+        if self.direct or self._fd is None:
+            return
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self._fd, offset, length, os.POSIX_FADV_WILLNEED)
+
+    def read_part(self, offset: int, length: int):
+        """Return a request body for ``length`` bytes of the file at ``offset``."""
+
+        if self._fd is None:
+            raise RuntimeError("source file not open")
+        if self.direct:
+            buf = _direct_buffer(length)
+            count = os.preadv(self._fd, [buf], offset)
+            if count < length:
+                raise RuntimeError(
+                    f"Short read at offset {offset}: got {count} of {length} bytes"
+                )
+            return _BufferReader(memoryview(buf)[:length])
+        if not self.use_mmap:
+            return _PartReader(self._fd, offset, length)
+        # A read-only mapping of just this part is a seekable file-like object
+        # that botocore streams from, so the part is never copied into a
+        # Python buffer and pages are faulted in as they are sent.
+        window = mmap.mmap(self._fd, length, offset=offset, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            window.madvise(mmap.MADV_SEQUENTIAL)
+        return window
+
+    def part_checksum(self, body) -> dict:
+        """Return checksum arguments for ``upload_part`` when cheap to compute.
+
+        A part that is already addressable in memory is checksummed with one
+        zlib call over the buffer instead of botocore's block-by-block pass
+        through the file object. Streamed parts are left to botocore.
+        """
+
+        if not self.precompute_checksums:
+            return {}
+        if isinstance(body, _BufferReader):
+            data = body.getbuffer()
+        elif isinstance(body, mmap.mmap):
+            data = body
+        else:
+            return {}
+        crc = zlib.crc32(data).to_bytes(4, byteorder="big")
+        return {"ChecksumCRC32": base64.b64encode(crc).decode("ascii")}
 
     def upload_part(
         self,
@@ -312,8 +827,6 @@ class LargeMultipartUploader:
         part_number: int,
         offset: int,
         bytes_to_read: int,
-        total_parts: int,
-        start_time: float,
     ) -> dict:
         """Upload a single part with exponential-backoff retries."""
 
@@ -323,33 +836,26 @@ class LargeMultipartUploader:
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.info(
-                    f"Part {part_number}: reading bytes {offset}–{offset+bytes_to_read} (attempt {attempt})"
-                )
-                with open(self.file_path, "rb") as f:
-                    f.seek(offset)
-                    data = f.read(bytes_to_read)
-                resp = self.s3.upload_part(
-                    Bucket=self.bucket,
-                    Key=self.key,
-                    PartNumber=part_number,
-                    UploadId=self.upload_id,
-                    Body=data,
-                )
-                etag = resp["ETag"]
-                with self.progress_lock:
-                    self.parts_completed += 1
-                    progress = 100.0 * self.parts_completed / total_parts
-                elapsed = time.time() - start_time
-                progress_fraction = part_number / total_parts
-                if progress_fraction > 0:
-                    remaining = max(0, elapsed * (1 / progress_fraction - 1))
-                    eta = time.strftime("%Hh %Mm %Ss", time.gmtime(remaining))
-                else:
-                    eta = "?"
-                logger.info(
-                    f"Part {part_number}: uploaded, progress: {progress:.1f}%, est time remaining: {eta}"
+                    "Part %d: reading bytes %d–%d (attempt %d)",
+                    part_number,
+                    offset,
+                    offset + bytes_to_read,
+                    attempt,
                 )
-                return {"PartNumber": part_number, "ETag": etag}
+                body = self.read_part(offset, bytes_to_read)
+                try:
+                    resp = self.s3.upload_part(
+                        Bucket=self.bucket,
+                        Key=self.key,
+                        PartNumber=part_number,
+                        UploadId=self.upload_id,
+                        Body=body,
+                        ContentLength=bytes_to_read,
+                        **self.part_checksum(body),
+                    )
+                finally:
+                    body.close()
+                return {"PartNumber": part_number, "ETag": resp["ETag"]}
             except (BotoCoreError, ClientError) as exc:
                 if self.is_insufficient_storage_error(exc):
                     logger.error(
@@ -369,10 +875,42 @@ class LargeMultipartUploader:
                         f"Part {part_number}: exceeded max_retries ({self.max_retries})"
                     )
                     raise
-                backoff = 2**attempt
-                logger.info(f"Part {part_number}: retrying in {backoff}s...")
+                backoff = self.backoff_delay(attempt)
+                logger.info(f"Part {part_number}: retrying in {backoff:.1f}s...")
                 time.sleep(backoff)
 
+    def log_progress(
+        self, *, part_number: int, total_parts: int, start_time: float
+    ) -> None:
+        """Record a completed part and log overall progress."""
+
+        done = next(self._progress)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        elapsed = time.time() - start_time
+        remaining = max(0.0, elapsed * (total_parts - part_number) / part_number)
+        logger.info(
+            "Part %d: uploaded, progress: %.1f%%, est time remaining: %s",
+            part_number,
+            100.0 * done / total_parts,
+            self.format_duration(remaining),
+        )
+
+    def _make_executor(self):
+        """Return the pool that part uploads are submitted to."""
+
+        if self.executor == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.concurrency,
+                initializer=_init_process_worker,
+                initargs=(
+                    self,
+                    logging.getLogger().getEffectiveLevel(),
+                    _http_send_buffer,
+                ),
+            )
+        return ThreadPoolExecutor(max_workers=self.concurrency)
+
     # ------------------------------------------------------------------
     # Main upload driver
     # ------------------------------------------------------------------
@@ -401,47 +939,87 @@ class LargeMultipartUploader:
         self.upload_id = resp["UploadId"]
         logger.info(f"Initiated multipart upload: UploadId={self.upload_id}")
 
-        parts: list[dict] = []
+        # Part numbers are dense, so each result goes straight to its slot and
+        # the list is already in the order CompleteMultipartUpload needs.
+        parts: list[dict | None] = [None] * total_parts
+        upload_part = (
+            _upload_part_in_process if self.executor == "process" else self.upload_part
+        )
         try:
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {}
-                for part_num in range(1, total_parts + 1):
-                    offset = (part_num - 1) * self.part_size
-                    chunk_size = min(self.part_size, file_size - offset)
-                    futures[
-                        executor.submit(
-                            self.upload_part,
-                            part_number=part_num,
-                            offset=offset,
-                            bytes_to_read=chunk_size,
+            self.open_source()
+            with self._make_executor() as executor:
+                # Keep a bounded window of parts in flight and top it up as
+                # each one finishes, rather than queueing every part up front.
+                offsets, sizes = self.part_layout(file_size, self.part_size)
+                pending = enumerate(zip(offsets, sizes), start=1)
+                window = 2 * self.concurrency
+                # Only hint the parts that workers will pick up next, not the
+                # whole submission window, so readahead stays within budget.
+                prefetch_depth = max(
+                    1, min(self.concurrency, PREFETCH_BUDGET // self.part_size)
+                )
+                next_prefetch = min(self.concurrency, total_parts)
+                completed = 0
+                inflight: set = set()
+                while True:
+                    for part_num, (offset, chunk_size) in itertools.islice(
+                        pending, window - len(inflight)
+                    ):
+                        inflight.add(
+                            executor.submit(
+                                upload_part,
+                                part_number=part_num,
+                                offset=offset,
+                                bytes_to_read=chunk_size,
+                            )
+                        )
+                    if not inflight:
+                        break
+                    prefetch_end = min(
+                        total_parts, completed + self.concurrency + prefetch_depth
+                    )
+                    while next_prefetch < prefetch_end:
+                        self.prefetch_part(offsets[next_prefetch], sizes[next_prefetch])
+                        next_prefetch += 1
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    completed += len(done)
+                    for fut in done:
+                        part = fut.result()
+                        parts[part["PartNumber"] - 1] = part
+                        self.log_progress(
+                            part_number=part["PartNumber"],
                             total_parts=total_parts,
                             start_time=start_time,
                         )
-                    ] = part_num
 
-                for fut in as_completed(futures):
-                    part = fut.result()
-                    parts.append(part)
+            missing = parts.count(None)
+            if missing:
+                raise RuntimeError(
+                    f"Expected {total_parts} parts but uploaded {total_parts - missing}"
+                )
+
+            if self.verify_parts:
 
-            def fetch_parts():
-                paginator = self.s3.get_paginator("list_parts")
-                found = []
-                for page in paginator.paginate(
-                    Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
-                ):
-                    found.extend(page.get("Parts", []))
-                return found
+                def fetch_parts():
+                    paginator = self.s3.get_paginator("list_parts")
+                    found = []
+                    for page in paginator.paginate(
+                        Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+                    ):
+                        found.extend(page.get("Parts", []))
+                    return found
 
-            seen = self.call_with_524_retry("list_parts", fetch_parts)
-            logger.info(f"Verified {len(seen)} of {total_parts} parts uploaded")
+                seen = self.call_with_524_retry("list_parts", fetch_parts)
+                logger.info(f"Verified {len(seen)} of {total_parts} parts uploaded")
 
-            if len(seen) != total_parts:
-                raise RuntimeError(f"Expected {total_parts} parts but saw {len(seen)}")
+                if len(seen) != total_parts:
+                    raise RuntimeError(
+                        f"Expected {total_parts} parts but saw {len(seen)}"
+                    )
 
-            parts_sorted = sorted(parts, key=lambda x: x["PartNumber"])
             logger.info("Sending complete_multipart_upload request")
             self.complete_with_timeout_retry(
-                parts_sorted=parts_sorted,
+                parts_sorted=parts,
                 initial_timeout=completion_timeout,
                 expected_size=file_size,
             )
@@ -467,17 +1045,51 @@ class LargeMultipartUploader:
             if self.upload_id:
                 logger.info(f"UploadId {self.upload_id} left open for resumption")
             raise
+        finally:
+            self.close_source()
 
         elapsed = time.time() - start_time
         speed = self.human_mb_per_s(file_size, elapsed)
-        duration = time.strftime("%Hh %Mm %Ss", time.gmtime(elapsed))
+        duration = self.format_duration(elapsed)
         logger.info(f"Upload Speed {speed:.2f} MB/s, Duration {duration}")
 
 
+# -----------------------------------------------------------------------------
+# ─── PROCESS POOL WORKERS ────────────────────────────────────────────────────
+# -----------------------------------------------------------------------------
+# Uploader owned by the current process-pool worker, set by its initializer.
+_worker_uploader: LargeMultipartUploader | None = None
+
+
+def _init_process_worker(
+    uploader: LargeMultipartUploader, log_level: int, send_buffer: int | None
+) -> None:
+    """Give this worker process its own S3 client and file descriptor."""
+
+    global _worker_uploader
+    logging.getLogger().setLevel(log_level)
+    if send_buffer is not None:
+        set_http_send_buffer(send_buffer)
+    # A forked worker inherits the parent's client and its open connections,
+    # so always build a fresh one rather than sharing sockets.
+    uploader._connect()
+    uploader.open_source()
+    _worker_uploader = uploader
+
+
+def _upload_part_in_process(**kwargs) -> dict:
+    """Upload one part using this worker process's uploader."""
+
+    if _worker_uploader is None:
+        raise RuntimeError("process worker not initialized")
+    return _worker_uploader.upload_part(**kwargs)
+
+
 if __name__ == "__main__":
     args = parse_args()
     if args.quiet:
         logging.getLogger().setLevel(logging.WARNING)
+    set_http_send_buffer(args.send_buffer)
     uploader = LargeMultipartUploader(
         file_path=args.file_path,
         bucket=args.bucket,
@@ -488,5 +1100,9 @@ if __name__ == "__main__":
         endpoint=args.endpoint,
         part_size=args.chunk_size,
         max_retries=args.max_retries,
+        concurrency=args.concurrency,
+        executor=args.executor,
+        verify_parts=args.verify_parts,
+        direct=args.direct,
     )
     uploader.upload()